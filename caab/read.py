@@ -10,6 +10,8 @@
 #   WITHOUT WARRANTY OF ANY KIND, either express or
 #   implied. See the License for the specific language governing
 #   rights and limitations under the License.
+from functools import lru_cache
+
 import dwc.transform
 from ala.transform import PublisherSource, CollectorySource
 from caab.schema import CaabSchema
@@ -25,40 +27,65 @@ from processing.transform import FilterTransform, MapTransform, strip_markup, no
     MergeTransform, LookupTransform
 
 
+_EXCLUDED_SPCODE_PREFIXES = ("99", "8")
+_ARTICLE_PREFIXES = ('a ', 'an ')
+
 def is_current_taxon(record: Record):
-    spcode = str(record.SPCODE)
-    return not record.NON_CURRENT_FLAG and not spcode.startswith("99") and not spcode.startswith("8") and (record.SCIENTIFIC_NAME is not None or record.DISPLAY_NAME is not None)
+    data = record.data
+    return not data.get('NON_CURRENT_FLAG') and not str(data.get('SPCODE')).startswith(_EXCLUDED_SPCODE_PREFIXES) and (data.get('SCIENTIFIC_NAME') is not None or data.get('DISPLAY_NAME') is not None)
+
+_SCIENTIFIC_START_MATCH = dwc.transform.SCIENTIFIC_START.match
 
 def is_usable_taxon(record: Record):
-    name: str = record.scientificName
+    name: str = record.data.get('scientificName')
     if name is None or len(name) < 2:
         return False
-    return dwc.transform.SCIENTIFIC_START.match(name)
+    return _SCIENTIFIC_START_MATCH(name) is not None
 
+@lru_cache(maxsize=65536)
 def clean_scientific(s: str):
+    # The classification columns repeat the same few values for every
+    # record, so cache cleaned results rather than re-cleaning them
     s = strip_markup(s)
     if s is None:
         return None
-    if s.startswith('"'):
-        s = s.replace('"', ' ')
-    s = normalise_spaces(s)
+    if s[0] == '"':
+        s = normalise_spaces(s.replace('"', ' '))
     return s
 
+def _strip_article(ss: str):
+    if ss[1] == ' ':
+        ss = ss[2:]
+        # stripping 'a ' can uncover a second article ('a an owl')
+        if ss.startswith('an '):
+            ss = ss[3:]
+        return ss
+    return ss[3:]
+
 def clean_common(s: str):
     if s is None or len(s) == 0:
         return None
+    if '|' not in s:
+        # The usual case is a single name; skip the split/join machinery.
+        # Bracketed names drop through to the general loop below.
+        ss = strip_markup(s)
+        if ss is None:
+            return ''
+        if ss[0] != '[':
+            if ss[0] == 'a' and ss.startswith(_ARTICLE_PREFIXES):
+                ss = _strip_article(ss)
+            return ss
     common = []
     for ss in s.split('|'):
+        # strip_markup leaves the fragment space-normalised, so it only
+        # needs renormalising if the bracket rule uncovers new edges
         ss = strip_markup(ss)
         if ss is None:
             continue
-        if ss.startswith('[') and ss.endswith(']'):
-            ss = ss[1:-1].strip()
-        if ss.startswith('a '):
-            ss = ss[2:]
-        if ss.startswith('an '):
-            ss = ss[3:]
-        ss = normalise_spaces(ss)
+        if ss[0] == '[' and ss[-1] == ']':
+            ss = normalise_spaces(ss[1:-1])
+        if ss is not None and ss[0] == 'a' and ss.startswith(_ARTICLE_PREFIXES):
+            ss = _strip_article(ss)
         common.append(ss)
     return '|'.join(common)
 
@@ -80,29 +107,29 @@ def reader() -> Orchestrator:
 
     nomenclatural_code_map = CsvSource.create("nomenclatural_code_map", nomenclatural_code_file, "ala", caab_nomenclatural_code_schema)
     name_patterns = CsvSource.create("name_patterns", scientific_name_status_file, 'excel', scientific_name_status_schema)
-    taxon_source = CsvSource.create("taxon_source", taxon_file, "excel", caab_schema, encoding='utf-8-sig', no_errors=True)
+    taxon_source = CsvSource.create("taxon_source", taxon_file, "excel", caab_schema, encoding='utf-8-sig', no_errors=True, intern_values=True)
     taxon_current = FilterTransform.create("taxon_current", taxon_source.output, is_current_taxon)
     taxon_clean = MapTransform.create("taxon_clean",  taxon_current.output, caab_schema, {
-        'SCIENTIFIC_NAME': (lambda r: clean_scientific(r.SCIENTIFIC_NAME)),
-        'AUTHORITY': (lambda r: strip_markup(r.AUTHORITY)),
-        'DISPLAY_NAME': (lambda r: clean_scientific(r.DISPLAY_NAME)),
-        'COMMON_NAME': (lambda r: clean_common(r.COMMON_NAME)),
-        'COMMON_NAMES_LIST': (lambda r: clean_common(r.COMMON_NAMES_LIST)),
-        'FAMILY': (lambda r: clean_scientific(r.FAMILY)),
-        'KINGDOM': (lambda r: clean_scientific(r.KINGDOM)),
-        'PHYLUM': (lambda r: clean_scientific(r.PHYLUM)),
-        'SUBPHYLUM': (lambda r: clean_scientific(r.SUBPHYLUM)),
-        'CLASS': (lambda r: clean_scientific(r.CLASS)),
-        'SUBCLASS': (lambda r: clean_scientific(r.SUBCLASS)),
-        'ORDER_NAME': (lambda r: clean_scientific(r.ORDER_NAME)),
-        'SUBORDER': (lambda r: clean_scientific(r.SUBORDER)),
-        'INFRAORDER': (lambda r: clean_scientific(r.INFRAORDER)),
-        'GENUS': (lambda r: clean_scientific(r.GENUS)),
-        'SPECIES': (lambda r: clean_scientific(r.SPECIES)),
-        'SUBSPECIES': (lambda r: clean_scientific(r.SUBSPECIES)),
-        'SUBGENUS': (lambda r: clean_scientific(r.SUBGENUS)),
-        'VARIETY': (lambda r: clean_scientific(r.VARIETY)),
-        'RANK': (lambda r: clean_rank(r.RANK))
+        'SCIENTIFIC_NAME': (lambda r: clean_scientific(r.data.get('SCIENTIFIC_NAME'))),
+        'AUTHORITY': (lambda r: strip_markup(r.data.get('AUTHORITY'))),
+        'DISPLAY_NAME': (lambda r: clean_scientific(r.data.get('DISPLAY_NAME'))),
+        'COMMON_NAME': (lambda r: clean_common(r.data.get('COMMON_NAME'))),
+        'COMMON_NAMES_LIST': (lambda r: clean_common(r.data.get('COMMON_NAMES_LIST'))),
+        'FAMILY': (lambda r: clean_scientific(r.data.get('FAMILY'))),
+        'KINGDOM': (lambda r: clean_scientific(r.data.get('KINGDOM'))),
+        'PHYLUM': (lambda r: clean_scientific(r.data.get('PHYLUM'))),
+        'SUBPHYLUM': (lambda r: clean_scientific(r.data.get('SUBPHYLUM'))),
+        'CLASS': (lambda r: clean_scientific(r.data.get('CLASS'))),
+        'SUBCLASS': (lambda r: clean_scientific(r.data.get('SUBCLASS'))),
+        'ORDER_NAME': (lambda r: clean_scientific(r.data.get('ORDER_NAME'))),
+        'SUBORDER': (lambda r: clean_scientific(r.data.get('SUBORDER'))),
+        'INFRAORDER': (lambda r: clean_scientific(r.data.get('INFRAORDER'))),
+        'GENUS': (lambda r: clean_scientific(r.data.get('GENUS'))),
+        'SPECIES': (lambda r: clean_scientific(r.data.get('SPECIES'))),
+        'SUBSPECIES': (lambda r: clean_scientific(r.data.get('SUBSPECIES'))),
+        'SUBGENUS': (lambda r: clean_scientific(r.data.get('SUBGENUS'))),
+        'VARIETY': (lambda r: clean_scientific(r.data.get('VARIETY'))),
+        'RANK': (lambda r: clean_rank(r.data.get('RANK')))
     }, auto=True)
     taxon_coded = LookupTransform.create('taxon_coded', taxon_clean.output, nomenclatural_code_map.output, 'KINGDOM', 'kingdom', record_unmatched=True)
     synonyms = DenormaliseTransform.delimiter("synonyms", taxon_coded.output, 'RECENT_SYNONYMS', '|', include_empty=False)
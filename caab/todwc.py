@@ -36,6 +36,13 @@ class CaabToDwcTaxonTaxonTransform(ReferenceTransform):
         output = Port.port(dwc.schema.TaxonSchema())
         return CaabToDwcTaxonTaxonTransform(id, input, output, None, reference, invalid, reference_keys, None, parent_keys, **kwargs)
 
+    def build_additional(self, context: ProcessingContext):
+        """Look up the context defaults once, rather than for every record"""
+        return {
+            'datasetID': context.get_default('datasetID'),
+            'nomenclaturalCode': context.get_default('nomenclaturalCode')
+        }
+
     def compose(self, record: Record, valid: Record, parent: Record, context: ProcessingContext, additional) -> Record:
         """
         A DwC version of the record
@@ -48,37 +55,38 @@ class CaabToDwcTaxonTaxonTransform(ReferenceTransform):
 
         :return: A composed record, or null for no record
         """
-        taxonID = str(record.SPCODE)
+        data = record.data
+        taxonID = str(data.get('SPCODE'))
         if taxonID is None:
             raise ProcessingException("Record has no taxonID")
-        scientificName = choose(record.DISPLAY_NAME, record.SCIENTIFIC_NAME)
+        scientificName = choose(data.get('DISPLAY_NAME'), data.get('SCIENTIFIC_NAME'))
         if scientificName is None:
             raise ProcessingException("Record has no scientific name")
         dwc = {
             'taxonID': taxonID,
-            'parentNameUsageID': str(parent.SPCODE) if parent is not None else None,
-            'datasetID': context.get_default('datasetID'),
-            'nomenclaturalCode': choose(record.nomenclaturalCode, context.get_default('nomenclaturalCode')),
+            'parentNameUsageID': str(parent.data.get('SPCODE')) if parent is not None else None,
+            'datasetID': additional['datasetID'],
+            'nomenclaturalCode': choose(data.get('nomenclaturalCode'), additional['nomenclaturalCode']),
             'scientificName': normalise_spaces(scientificName),
-            'scientificNameAuthorship': record.AUTHORITY,
-            'kingdom': record.KINGDOM,
-            'phylum': record.PHYLUM,
-            'subphylum': record.SUBPHYLUM,
-            'class': record.CLASS,
-            'subclass': record.SUBCLASS,
-            'order': record.ORDER_NAME,
-            'suborder': record.SUBORDER,
-            'infraorder': record.INFRAORDER,
-            'family': record.FAMILY,
-            'genus': record.GENUS,
-            'subgenus': record.SUBGENUS,
-            'specificEpithet': record.SPECIFICEPITHET,
-            'infraspecificEpithet': record.INFRASPECIFICEPITHET,
-            'taxonRank': choose(record.RANK, 'unknown'),
+            'scientificNameAuthorship': data.get('AUTHORITY'),
+            'kingdom': data.get('KINGDOM'),
+            'phylum': data.get('PHYLUM'),
+            'subphylum': data.get('SUBPHYLUM'),
+            'class': data.get('CLASS'),
+            'subclass': data.get('SUBCLASS'),
+            'order': data.get('ORDER_NAME'),
+            'suborder': data.get('SUBORDER'),
+            'infraorder': data.get('INFRAORDER'),
+            'family': data.get('FAMILY'),
+            'genus': data.get('GENUS'),
+            'subgenus': data.get('SUBGENUS'),
+            'specificEpithet': data.get('SPECIFICEPITHET'),
+            'infraspecificEpithet': data.get('INFRASPECIFICEPITHET'),
+            'taxonRank': choose(data.get('RANK'), 'unknown'),
             'taxonConceptID': taxonID,
             'taxonomicStatus': self.taxonomicStatus,
             'nomenclaturalStatus': None,
-            'taxonomicFlags': record.taxonomicFlags
+            'taxonomicFlags': data.get('taxonomicFlags')
         }
         errors = self.output.schema.validate(dwc)
         if errors:
@@ -97,6 +105,13 @@ class CaabToDwcTaxonSynonymTransform(ThroughTransform):
         output = Port.port(dwc.schema.TaxonSchema())
         return CaabToDwcTaxonSynonymTransform(id, input, output, None, **kwargs)
 
+    def build_additional(self, context: ProcessingContext):
+        """Look up the context defaults once, rather than for every record"""
+        return {
+            'datasetID': context.get_default('datasetID'),
+            'nomenclaturalCode': context.get_default('nomenclaturalCode')
+        }
+
     def compose(self, record: Record, context: ProcessingContext, additional) -> Record:
         """
         A DwC version of the record
@@ -109,23 +124,24 @@ class CaabToDwcTaxonSynonymTransform(ThroughTransform):
 
         :return: A composed record, or null for no record
         """
-        taxonID = "SY_" + str(record.SPCODE) + "_" + str(record.data.get("_index", 0))
+        data = record.data
+        taxonID = "SY_" + str(data.get('SPCODE')) + "_" + str(data.get("_index", 0))
         if taxonID is None:
             raise ProcessingException("Record has no taxonID")
-        scientificName = record.RECENT_SYNONYMS
+        scientificName = data.get('RECENT_SYNONYMS')
         if scientificName is None:
             raise ProcessingException("Record has no scientific name")
         dwc = {
             'taxonID': taxonID,
-            'acceptedNameUsageID': str(record.SPCODE),
-            'datasetID': context.get_default('datasetID'),
-            'nomenclaturalCode': choose(record.nomenclaturalCode, context.get_default('nomenclaturalCode')),
+            'acceptedNameUsageID': str(data.get('SPCODE')),
+            'datasetID': additional['datasetID'],
+            'nomenclaturalCode': choose(data.get('nomenclaturalCode'), additional['nomenclaturalCode']),
             'scientificName': normalise_spaces(scientificName),
-            'taxonRank': choose(record.RANK, "unknown"),
+            'taxonRank': choose(data.get('RANK'), "unknown"),
             'taxonConceptID': taxonID,
             'taxonomicStatus': self.taxonomicStatus,
             'nomenclaturalStatus': None,
-            'taxonomicFlags': record.taxonomicFlags
+            'taxonomicFlags': data.get('taxonomicFlags')
         }
         errors = self.output.schema.validate(dwc)
         if errors:
@@ -145,6 +161,15 @@ class CaabToDwcVernacularTransform(ThroughTransform):
         output = Port.port(dwc.schema.VernacularSchema())
         return CaabToDwcVernacularTransform(id, input, output, None, **kwargs)
 
+    def build_additional(self, context: ProcessingContext):
+        """Look up the context defaults once, rather than for every record"""
+        return {
+            'datasetID': context.get_default('datasetID'),
+            'language': context.get_default('language'),
+            'countryCode': context.get_default('countryCode'),
+            'source': context.get_default('source')
+        }
+
     def compose(self, record: Record, context: ProcessingContext, additional) -> Record:
         """
         A DwC version of the record
@@ -157,25 +182,30 @@ class CaabToDwcVernacularTransform(ThroughTransform):
 
         :return: A composed record, or null for no record
         """
-        vernacularName = record.COMMON_NAME if self.isPreferredName else record.COMMON_NAMES_LIST
+        data = record.data
+        common_name = data.get('COMMON_NAME')
+        common_names_list = data.get('COMMON_NAMES_LIST')
+        vernacularName = common_name if self.isPreferredName else common_names_list
         if vernacularName is None:
             return None
-        if not self.isPreferredName and record.COMMON_NAME is not None and record.COMMON_NAMES_LIST is not None and record.COMMON_NAME.lower() == record.COMMON_NAMES_LIST.lower():
+        if not self.isPreferredName and common_name is not None and common_names_list is not None and common_name.lower() == common_names_list.lower():
             return None
-        taxonID = str(record.SPCODE)
-        nameID = ('SV_' if self.isPreferredName else 'V_') + str(record.SPCODE) + ('_' + str(record._index) if record._index else '')
+        spcode = str(data.get('SPCODE'))
+        index = data.get('_index')
+        taxonID = spcode
+        nameID = ('SV_' if self.isPreferredName else 'V_') + spcode + ('_' + str(index) if index else '')
         if taxonID is None:
             raise ProcessingException("Record has no taxonID")
         dwc = {
             'taxonID': taxonID,
             'nameID': nameID,
-            'datasetID': context.get_default('datasetID'),
+            'datasetID': additional['datasetID'],
             'vernacularName': string.capwords(vernacularName),
             'status': self.status,
-            'language': context.get_default('language'),
-            'countryCode': context.get_default('countryCode'),
+            'language': additional['language'],
+            'countryCode': additional['countryCode'],
             'isPreferredName': self.isPreferredName,
-            'source': context.get_default('source')
+            'source': additional['source']
         }
         errors = self.output.schema.validate(dwc)
         if errors:
@@ -39,15 +39,23 @@ class NameFormatter:
         name_to_html = importlib.resources.read_text(__package__, 'name_to_html.xslt', 'utf-8')
         name_to_html = fromstring(name_to_html)
         self.name_to_html = XSLT(name_to_html)
+        self.formatted = {}
 
     def format(self, name: str, rank: str):
         if name is None:
             return None
-        name = name.replace('&amp;', '&').replace('&', '&amp;') # Sigh
-        name = fromstring(name)
-        name = self.name_to_html(name, rank=XSLT.strparam(rank))
-        name = normalise_spaces(str(name))
-        return name
+        # The same formatted name tends to turn up repeatedly (accepted
+        # usages, synonyms and instances of one name); running the XSLT
+        # once per distinct (name, rank) pair is considerably cheaper
+        key = (name, rank)
+        if key in self.formatted:
+            return self.formatted[key]
+        formatted = name.replace('&amp;', '&').replace('&', '&amp;') # Sigh
+        formatted = fromstring(formatted)
+        formatted = self.name_to_html(formatted, rank=XSLT.strparam(rank))
+        formatted = normalise_spaces(str(formatted))
+        self.formatted[key] = formatted
+        return formatted
 
 
 @attr.s
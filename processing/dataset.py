@@ -27,7 +27,7 @@ class Record:
 class Port:
     pass
 
-@attr.s(eq=False)
+@attr.s(eq=False, slots=True)
 class Record:
     """
     A data record.
@@ -299,7 +299,7 @@ class Port:
         """
         return self.schema.fields.keys()
 
-@attr.s(eq=False, repr=False)
+@attr.s(eq=False, repr=False, slots=True)
 class Dataset:
     schema: Schema = attr.ib()
     rows: List[Record] = attr.ib(factory=list)
@@ -16,6 +16,7 @@ import gc
 import logging
 import os
 import tempfile
+import threading
 from typing import List, Set, Dict
 
 import attr
@@ -267,6 +268,7 @@ class ProcessingContext(Node):
     fail_on_error: bool = attr.ib(default=True)
     sub_context_count: int = attr.ib(default=0, kw_only=True)
     dump: bool = attr.ib(default=False, kw_only=True)
+    sub_context_lock: threading.Lock = attr.ib(factory=threading.Lock, init=False, kw_only=True)
 
     @handler.default
     def _default_handler(self):
@@ -324,8 +326,9 @@ class ProcessingContext(Node):
         )
 
     def subid(self):
-        self.sub_context_count += 1
-        return self.id + "_" + str(self.sub_context_count)
+        with self.sub_context_lock:
+            self.sub_context_count += 1
+            return self.id + "_" + str(self.sub_context_count)
 
     def merge(self, subcontext: ProcessingContext):
         """
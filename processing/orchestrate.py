@@ -12,6 +12,7 @@
 #   rights and limitations under the License.
 
 import os.path
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Set
 
 import attr
@@ -24,7 +25,15 @@ from processing.node import Node, ProcessingContext, ProcessingException
 
 @attr.s
 class Orchestrator(Node):
+    """
+    Run a collection of nodes, repeatedly executing whatever can be satisfied.
+
+    max_workers: The number of nodes to run concurrently (1, the default, runs
+        nodes one at a time as before; higher values run independent nodes in
+        a bounded thread pool)
+    """
     nodes: List[Node] = attr.ib(factory=list)
+    max_workers: int = attr.ib(default=1, kw_only=True)
 
     def report(self, context: ProcessingContext):
         self.logger.info("Executed")
@@ -156,34 +165,64 @@ class Orchestrator(Node):
         """
         Execute by repeatedly executing any sub-node that can be satisified.
 
+        If max_workers is greater than one, each batch of ready nodes is run
+        concurrently in a bounded thread pool; nodes still see complete input
+        datasets, so only independent stages overlap.
+
         :param context: The processing context
 
         :return:
         """
-        completed = False
         done = []
+        if self.max_workers > 1:
+            self._execute_parallel(context, done)
+        else:
+            self._execute_sequential(context, done)
+        self.execute_dangling_ports(context)
+        self.dump_graph(context)
+        invalid = [node.id for node in self.nodes if not node.is_executable(context)]
+        if len(invalid) > 0:
+            raise ProcessingException(f"Unable to complete nodes {invalid}")
+
+    def _execute_sequential(self, context: ProcessingContext, done: List[Node]):
+        completed = False
         while not completed:
             completed = True
             ready = [node for node in self.nodes if node.is_executable(context) and node not in done]
             if len(ready) > 0:
                 node = ready[0]
-                try:
-                    node.run(context)
-                    context.completed.add(node.id)
-                    done.append(node)
-                    if node.no_errors and context.has_errors(node):
-                        self.logger.warning("Halting on errors from %s", node)
-                        self.execute_dangling_ports(context)
-                        raise ProcessingException(f"Halting on errors from {node}")
-                    completed = False
-                except Exception as err:
-                    self.logger.error("Error processing node %s - %s", node.id, err)
-                    raise err
-        self.execute_dangling_ports(context)
-        self.dump_graph(context)
-        invalid = [node.id for node in self.nodes if not node.is_executable(context)]
-        if completed and len(invalid) > 0:
-            raise ProcessingException(f"Unable to complete nodes {invalid}")
+                self._complete(node, None, context, done)
+                completed = False
+
+    def _execute_parallel(self, context: ProcessingContext, done: List[Node]):
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while True:
+                ready = [node for node in self.nodes if node.is_executable(context) and node not in done]
+                if len(ready) == 0:
+                    break
+                running = [(node, executor.submit(node.run, context)) for node in ready]
+                for (node, future) in running:
+                    self._complete(node, future, context, done)
+
+    def _complete(self, node: Node, future, context: ProcessingContext, done: List[Node]):
+        """
+        Run a node (or collect a node run on the thread pool) and record completion,
+        halting if the node has produced errors.
+        """
+        try:
+            if future is None:
+                node.run(context)
+            else:
+                future.result()
+            context.completed.add(node.id)
+            done.append(node)
+            if node.no_errors and context.has_errors(node):
+                self.logger.warning("Halting on errors from %s", node)
+                self.execute_dangling_ports(context)
+                raise ProcessingException(f"Halting on errors from {node}")
+        except Exception as err:
+            self.logger.error("Error processing node %s - %s", node.id, err)
+            raise err
 
     def __enter__(self):
         current = processing.node._CURRENT_ORCHESTRATOR
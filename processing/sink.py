@@ -40,6 +40,7 @@ class Sink(Node):
                       fields.values()}
         if self.required_fields is None:
             self.required_fields = set([ field.name for field in fields.values() if field.metadata.get('export', False) ])
+        self._serializers = {name: (self.fieldkeys.get(name, name), field) for (name, field) in fields.items()}
 
     def inputs(self) -> Dict[str, Port]:
         inputs = super().inputs()
@@ -56,19 +57,21 @@ class Sink(Node):
 
         :return: The resulting formatted dictionary
         """
-        fields = self.input.schema.fields
+        serializers = self._serializers
+        values = record.data
         data = OrderedDict()
         if line is not None:
             data['#'] = str(line)
         for name in fieldnames:
-            if name in fields:
-                value = record.data.get(name)
-                dk = self.fieldkeys.get(name, name)
+            entry = serializers.get(name)
+            if entry is not None:
+                (dk, field) = entry
                 if dk is None:
-                    self.logger.warning("Null key for %s in record %d", v, record.line)
+                    self.logger.warning("Null key for %s in record %d", name, record.line)
                     continue
+                value = values.get(name)
                 try:
-                    ser = '' if value is None else fields[name]._serialize(value, name, record.data)
+                    ser = '' if value is None else field._serialize(value, name, values)
                 except Exception as err:
                     if self.no_errors:
                         raise err
@@ -93,11 +96,16 @@ class Sink(Node):
         if len(input.rows) == 0:
             return self.fieldnames
         seen = self.required_fields.copy()
+        remaining = set(self.fieldnames) - seen
         for record in input.rows:
-            for (key, value) in record.data.items():
-                if value is not None:
-                    seen.add(key)
-        return list(filter(lambda name: name in seen, self.fieldnames))
+            if not remaining:
+                break
+            data = record.data
+            found = [key for key in remaining if data.get(key) is not None]
+            if found:
+                seen.update(found)
+                remaining.difference_update(found)
+        return [name for name in self.fieldnames if name in seen]
 
 
     def fileName(self):
@@ -14,6 +14,7 @@
 import sys
 import csv
 from os import path
+from sys import intern
 from typing import Dict, Callable
 
 import attr
@@ -84,6 +85,7 @@ class CsvSource(Source):
     encoding: str = attr.ib(default='utf-8', kw_only=True)
     comment: str = attr.ib(default='#', kw_only=True)
     search_output: bool = attr.ib(default=False, kw_only=True)
+    intern_values: bool = attr.ib(default=False, kw_only=True)
 
     @classmethod
     def create(cls, id: str, file: path, dialect: str, schema: marshmallow.Schema, **kwargs):
@@ -103,12 +105,22 @@ class CsvSource(Source):
         errors = Dataset.for_port(self.error)
         filename = context.locate_input_file(self.file, self.search_output)
         with open(filename, "r", encoding=self.encoding) as ifile:
-            reader = csv.DictReader(self.decomment(ifile), dialect=self.dialect)
+            source = self.decomment(ifile) if self.comment is not None else ifile
+            reader = csv.DictReader(source, dialect=self.dialect)
+            load = self.output.schema.load
+            predicate = self.predicate
+            intern_values = self.intern_values
             line = 1
             for row in reader:
                 try:
-                    value = Record(line, self.output.schema.load(row), None)
-                    if self.predicate is None or self.predicate(value):
+                    data = load(row)
+                    if intern_values:
+                        # Share the storage for values that repeat from row to row
+                        for (key, val) in data.items():
+                            if type(val) is str:
+                                data[key] = intern(val)
+                    value = Record(line, data, None)
+                    if predicate is None or predicate(value):
                         dataset.add(value)
                         self.count(self.ACCEPTED_COUNT, value, context)
                 except marshmallow.ValidationError as err:
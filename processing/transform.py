@@ -33,7 +33,6 @@ from processing.node import Node, ProcessingContext, ProcessingException
 
 HREF_MARKUP = re.compile(r'\s*<a [^>]*href\s*=\s*"([^"]*)"[^>]*>')
 STRIP_MARKUP = re.compile(r'(<!--.*-->|<[^>]*>)')
-NORMALISE_SPACES = re.compile(r'\s+')
 
 
 def choose(*choices):
@@ -46,10 +45,11 @@ def choose(*choices):
 def normalise_spaces(s: str):
     if s is None:
         return None
-    s = s.strip()
-    if s is None or len(s) == 0:
+    # split()/join is the C-level equivalent of stripping and collapsing
+    # every whitespace run to a single space
+    s = ' '.join(s.split())
+    if len(s) == 0:
         return None
-    s = NORMALISE_SPACES.sub(' ', s)
     return s
 
 def strip_markup(s: str):
@@ -65,10 +65,12 @@ def strip_markup(s: str):
     s = s.strip()
     if s is None or len(s) == 0:
         return None
-    s = STRIP_MARKUP.sub('', s)
-    s = s.replace('&lt;', '<')
-    s = s.replace('&gt;', '>')
-    s = s.replace('&amp;', '&')
+    if '<' in s:
+        s = STRIP_MARKUP.sub('', s)
+    if '&' in s:
+        s = s.replace('&lt;', '<')
+        s = s.replace('&gt;', '>')
+        s = s.replace('&amp;', '&')
     return normalise_spaces(s)
 
 def extract_href(s: str) -> str:
@@ -188,22 +190,25 @@ class ThroughTransform(Transform):
         errors = Dataset.for_port(self.error)
         rejects = Dataset.for_port(self.reject) if self.reject is not None else None
         additional = self.build_additional(context)
+        compose = self.compose
+        count = self.count
+        accept = result.add
         for row in data.rows:
             try:
-                transformed = self.compose(row, context, additional)
+                transformed = compose(row, context, additional)
                 if transformed is not None:
-                    self.count(self.ACCEPTED_COUNT, row, context)
-                    result.add(transformed)
+                    count(self.ACCEPTED_COUNT, row, context)
+                    accept(transformed)
                 else:
                     if rejects is not None:
-                        self.count(self.REJECTED_COUNT, row, context)
+                        count(self.REJECTED_COUNT, row, context)
                         rejects.add(row)
             except Exception as err:
                 if self.fail_on_exception:
                     raise err
                 errors.add(Record.error(row, err))
-                self.count(self.ERROR_COUNT, row, context)
-            self.count(self.PROCESSED_COUNT, row, context)
+                count(self.ERROR_COUNT, row, context)
+            count(self.PROCESSED_COUNT, row, context)
         context.save(self.output, result)
         context.save(self.error, errors)
         if self.reject is not None:
@@ -315,6 +320,10 @@ class LookupTransform(Transform):
     merge: bool = attr.ib(default=True, kw_only=True)
     overwrite: bool = attr.ib(default=False, kw_only=True)
 
+    def __attrs_post_init__(self):
+        super().__attrs_post_init__()
+        self._link_remaps = {}
+
     @classmethod
     def create(cls, id: str, input: Port, lookup: Port, input_keys, lookup_keys, **kwargs):
         """
@@ -403,6 +412,10 @@ class LookupTransform(Transform):
             outputs['unmatched'] = self.unmatched
         return outputs
 
+    def build_additional(self, context: ProcessingContext):
+        self._link_remaps = {}
+        return super().build_additional(context)
+
     def execute(self, context: ProcessingContext):
         super().execute(context)
         data = context.acquire(self.input)
@@ -454,18 +467,24 @@ class LookupTransform(Transform):
         if link is None:
             linked_data = self._remap(record.data, self.input_map)
         else:
-            linked_data = {}
+            # The same lookup record is typically joined to many input rows,
+            # so remap it once and re-use the result
+            key = id(link)
+            remapped = self._link_remaps.get(key)
+            if remapped is None:
+                remapped = self._remap(link.data, self.lookup_map)
+                self._link_remaps[key] = remapped
             if self.overwrite:
-                linked_data.update(self._remap(record.data, self.input_map))
-                linked_data.update(self._remap(link.data, self.lookup_map))
+                linked_data = self._remap(record.data, self.input_map)
+                linked_data.update(remapped)
             else:
-                linked_data.update(self._remap(link.data, self.lookup_map))
+                linked_data = dict(remapped)
                 linked_data.update(self._remap(record.data, self.input_map))
         return Record(record.line, linked_data, record.issues)
 
     def _remap(self, data: dict, map: dict):
         if map is None:
-            return dict(filter(lambda item: item[1] is not None, data.items()))
+            return {key: value for (key, value) in data.items() if value is not None}
         return {map[key]: value for (key, value) in data.items() if key in map and value is not None}
 
 @attr.s
@@ -474,6 +493,10 @@ class MergeTransform(Transform):
     sources: List[Port] = attr.ib()
     output: Port = attr.ib()
 
+    def __attrs_post_init__(self):
+        super().__attrs_post_init__()
+        self._passthrough = set()
+
     @classmethod
     def create(cls, id: str, *args, **kwargs):
         output = Port.port(args[0].schema)
@@ -498,6 +521,11 @@ class MergeTransform(Transform):
         result = Dataset.for_port(self.output)
         errors = Dataset.for_port(self.error)
         additional = self.build_additional(context)
+        output_fields = self.output.schema.fields.keys()
+        self._passthrough = set(
+            id(source) for source in self.sources
+            if source.schema is self.output.schema or source.schema.fields.keys() == output_fields
+        )
         for source in self.sources:
             data = context.acquire(source)
             for row in data.rows:
@@ -526,7 +554,7 @@ class MergeTransform(Transform):
 
         :return: A composed record, or null for no record
         """
-        if source.schema is self.output.schema:
+        if id(source) in self._passthrough:
             return record
         return record.mapped(self.output)
 
@@ -537,6 +565,15 @@ class MapTransform(ThroughTransform):
     """
     map: Dict[str, Callable] = attr.ib()
 
+    def __attrs_post_init__(self):
+        """
+        Pre-compute the arity of each mapping function.
+        Inspecting the signature is expensive and compose is run once per record,
+        so work out how each transform needs to be called up-front.
+        """
+        super().__attrs_post_init__()
+        self._mappers = [(name, len(signature(transform).parameters), transform) for (name, transform) in self.map.items()]
+
     @classmethod
     def create(cls, id: str, input: Port, schema: Schema, map: Dict[str, object], auto=False, **kwargs):
         if schema is None:
@@ -774,9 +811,7 @@ class MapTransform(ThroughTransform):
         :return: The transformed record, or None for an ingored record
         """
         data = { }
-        for (name, transform) in self.map.items():
-            sig = signature(transform)
-            nargs = len(sig.parameters)
+        for (name, nargs, transform) in self._mappers:
             if nargs == 0:
                 data[name] = transform()
             elif nargs == 1:
@@ -786,7 +821,7 @@ class MapTransform(ThroughTransform):
             elif nargs == 3:
                 data[name] = transform(record, context, additional)
             else:
-                raise ProcessingException("Unable to process function with signature " + str(sig))
+                raise ProcessingException("Unable to process function with signature " + str(signature(transform)))
         self.output.schema.validate(data)
         return Record(record.line, data, record.issues)
 
@@ -909,32 +944,38 @@ class DenormaliseTransform(ThroughTransform):
     @classmethod
     def _delimiter_expand(cls, r: Record, field: str, delimiter: str):
         value: str = r.data.get(field)
-        value = value.strip() if value is not None else None
-        if value is None or len(value) == 0:
+        if value is None:
+            return None
+        value = value.strip()
+        if len(value) == 0:
             return None
-        return str(value).split(delimiter)
+        return value.split(delimiter)
 
     def execute(self, context: ProcessingContext):
         data = context.acquire(self.input)
         result = Dataset.for_port(self.output)
         errors = Dataset.for_port(self.error)
         additional = self.build_additional(context)
+        expander = self.expander
+        compose = self.compose
+        count = self.count
+        accept = result.add
         for record in data.rows:
             try:
-                self.count(self.PROCESSED_COUNT, record, context)
-                values = self.expander(record)
+                count(self.PROCESSED_COUNT, record, context)
+                values = expander(record)
                 if values is None or len(values) == 0:
                     if self.include_empty:
-                        result.add(record)
-                        self.count(self.ACCEPTED_COUNT, record, context, 0)
+                        accept(record)
+                        count(self.ACCEPTED_COUNT, record, context, 0)
                     continue
                 index = 0
                 for v in values:
                     v = v.strip()
                     if len(v) > 0:
-                        composed = self.compose(record, context, additional, v, index)
-                        result.add(composed)
-                        self.count(self.ACCEPTED_COUNT, composed, context)
+                        composed = compose(record, context, additional, v, index)
+                        accept(composed)
+                        count(self.ACCEPTED_COUNT, composed, context)
                         index += 1
             except Exception as err:
                 if self.fail_on_exception: